@@ -42,7 +42,7 @@ def discrete_compound_interest(
     principal: np.ndarray,
     rate: float,
     time: np.ndarray,
-    freq: int = 1,
+    freq: int | np.ndarray = 1,
 ) -> np.ndarray:
     """Compute future value under periodic compounding.
 
@@ -53,7 +53,9 @@ def discrete_compound_interest(
         principal (np.ndarray): Array of P.
         rate (float): Annual rate r.
         time (np.ndarray): Array of t in years.
-        freq (int): Number of compounding periods per year m.
+        freq (int | np.ndarray): Number of compounding periods per year m.
+            An array of frequencies broadcasts against ``principal`` and
+            ``time``, evaluating every frequency in one call.
 
     Returns:
         np.ndarray: Future values A = P * (1 + r/m)^(m * t).
@@ -63,7 +65,10 @@ def discrete_compound_interest(
         >>> discrete_compound_interest(np.array([100.]), 0.12, np.array([2.0]), freq=4)
         array([126.82503013])
     """
-    return principal * np.power(1 + rate / freq, freq * time)
+    # exp(m*t * log1p(r/m)) instead of power(1 + r/m, m*t): non-integer
+    # exponents send np.power down a scalar libm path, while exp/log1p use
+    # NumPy's SIMD transcendental loops
+    return principal * np.exp(freq * time * np.log1p(rate / freq))
 
 def continuous_compound_interest(
     principal: np.ndarray,
@@ -1,5 +1,5 @@
 import numpy as np
-from quantKit.stats.stat_helpers import atr, normal_cdf
+from quantKit.stats.stat_helpers import atr, _normal_cdf_scalar
 from quantKit.math.math_helpers import LogReturns
 from quantKit.indicators.Indicator import Indicator
 
@@ -63,7 +63,9 @@ class CMMA(Indicator):
             if atr_value[i] > 0.0:
                 denom = atr_value[i] * np.sqrt(self.lookback + 1.0)
                 cmma_raw = (log_returns[i] - sum_log) / denom
-                cmma_values[i] = 100.0 * normal_cdf(1.0 * cmma_raw) - 50.0
+                # Scalar kernel: skips the array wrapping normal_cdf does
+                # for vectorized callers, which dominates at one call per bar
+                cmma_values[i] = 100.0 * _normal_cdf_scalar(1.0 * cmma_raw) - 50.0
             else:
                 cmma_values[i] = 0.0
 
@@ -48,8 +48,15 @@ def generate_basic_stats_report(
         min_value = float(np.min(values))
         max_value = float(np.max(values))
 
-        # IQR calculation
-        q1, q3 = np.percentile(values, [25, 75], method='midpoint')
+        # IQR via partial sort: partition at the four order statistics the
+        # midpoint quartiles need instead of fully sorting the column
+        n_valid = values.size
+        h1 = 0.25 * (n_valid - 1)
+        h3 = 0.75 * (n_valid - 1)
+        kth = [int(np.floor(h1)), int(np.ceil(h1)), int(np.floor(h3)), int(np.ceil(h3))]
+        part = np.partition(values, kth)
+        q1 = 0.5 * (part[kth[0]] + part[kth[1]])
+        q3 = 0.5 * (part[kth[2]] + part[kth[3]])
         interquartile_range = float(q3 - q1)
 
         # Range/IQR calculation
@@ -1,13 +1,57 @@
 import multiprocessing as mp
+from multiprocessing import shared_memory
 import numpy as np
-from quantKit.stats.stat_helpers import mutual_info
+from quantKit.stats.stat_helpers import mutual_info_kernel
 from quantKit.stats.mcpt.BatchCyclicPermutation import bcp
 
+# Worker-side views of the shared bin matrices, attached once per process by
+# the Pool initializer so tasks only carry small index tuples.
+_feature_bins = None
+_target_perm_bins = None
+_nbins_feature = None
+_nbins_target = None
+
+def _attach_shared_bins(
+    feat_shm_name, feat_shape, feat_dtype,
+    targ_shm_name, targ_shape, targ_dtype,
+    nbins_feature, nbins_target
+):
+    """Attach this worker process to the shared feature/target bin buffers."""
+    global _feature_bins, _target_perm_bins, _nbins_feature, _nbins_target
+    feat_shm = shared_memory.SharedMemory(name=feat_shm_name)
+    targ_shm = shared_memory.SharedMemory(name=targ_shm_name)
+    _feature_bins = np.ndarray(feat_shape, dtype=feat_dtype, buffer=feat_shm.buf)
+    _target_perm_bins = np.ndarray(targ_shape, dtype=targ_dtype, buffer=targ_shm.buf)
+    _nbins_feature = nbins_feature
+    _nbins_target = nbins_target
+    # Keep the handles alive for the lifetime of the worker
+    _attach_shared_bins.shms = (feat_shm, targ_shm)
+
+def _permuted_mi_task(ifeat, itarg, iperm):
+    """Compute MI for one (feature, target, permutation) triple from shared bins."""
+    return mutual_info_kernel(
+        _feature_bins[ifeat],
+        _target_perm_bins[itarg, iperm],
+        _nbins_feature,
+        _nbins_target
+    )
+
+def _bin_dtype(nbins: int) -> np.dtype:
+    """Narrowest index dtype that can hold nbins bin labels without wrapping."""
+    return np.dtype(np.uint8) if nbins <= 256 else np.dtype(np.intp)
+
+def _bin_indices(values: np.ndarray, nbins: int) -> np.ndarray:
+    """Discretize values into equal-width bin indices (same binning as mutual_info)."""
+    bins = np.linspace(np.min(values), np.max(values), nbins + 1)
+    return np.clip(
+        np.searchsorted(bins, values, side='right') - 1, 0, nbins - 1
+    ).astype(_bin_dtype(nbins))
+
 def generate_mi_report(
-    features: np.recarray, 
-    target: np.recarray, 
-    nbins_feature: int = 10, 
-    nbins_target: int = 10, 
+    features: np.recarray,
+    target: np.recarray,
+    nbins_feature: int = 10,
+    nbins_target: int = 10,
     n_permutations: int = 100
 ) -> None:
     """
@@ -23,46 +67,80 @@ def generate_mi_report(
     feature_fields = [field for field in features.dtype.names if field != 'Date']
     target_fields = [field for field in target.dtype.names if field != 'Date']
 
-    original_mi_scores = []
+    n = len(features)
+    n_features = len(feature_fields)
+    n_targets = len(target_fields)
 
-    # Calculate original mutual information scores
-    for feature_field in feature_fields:
-        for target_field in target_fields: 
-            mi_score = mutual_info(
-                features[feature_field], 
-                target[target_field], 
-                nbins_feature=nbins_feature, 
-                nbins_target=nbins_target
-            )
-            original_mi_scores.append((feature_field, target_field, mi_score))
+    # Bin each variable once. Binning is pointwise, so cyclically permuting the
+    # binned target is identical to binning the permuted target — the bcp
+    # permutations can operate directly on the bin indices. uint8 keeps the
+    # shared buffers small for the common bin counts; wider counts get intp.
+    feat_dtype = _bin_dtype(nbins_feature)
+    targ_dtype = _bin_dtype(nbins_target)
+    feature_bins = np.empty((n_features, n), dtype=feat_dtype)
+    for i, feature_field in enumerate(feature_fields):
+        feature_bins[i] = _bin_indices(
+            np.asarray(features[feature_field]).flatten(), nbins_feature
+        )
 
-    original_mi_scores = np.array([score[2] for score in original_mi_scores])
+    target_bins = np.empty((n_targets, n), dtype=targ_dtype)
+    for j, target_field in enumerate(target_fields):
+        target_bins[j] = _bin_indices(
+            np.asarray(target[target_field]).flatten(), nbins_target
+        )
 
-    target_permutations = []
+    # Calculate original mutual information scores
+    original_mi_scores = np.empty((n_features, n_targets))
+    for i in range(n_features):
+        for j in range(n_targets):
+            original_mi_scores[i, j] = mutual_info_kernel(
+                feature_bins[i], target_bins[j], nbins_feature, nbins_target
+            )
 
-    # Generate permutations for each target field
-    for target_field in target_fields:
-        target_permutations.append(bcp(target[target_field], n_permutations))
+    # Stage the feature bins and permuted target bins in shared memory so Pool
+    # workers attach once instead of receiving the arrays with every task.
+    feat_shm = shared_memory.SharedMemory(create=True, size=feature_bins.nbytes)
+    targ_shape = (n_targets, n_permutations, n)
+    targ_shm = shared_memory.SharedMemory(
+        create=True, size=n_targets * n_permutations * n * targ_dtype.itemsize
+    )
+    try:
+        shared_feat = np.ndarray(feature_bins.shape, dtype=feat_dtype, buffer=feat_shm.buf)
+        shared_feat[:] = feature_bins
 
-    # Convert to a NumPy array for easier handling
-    target_permutations = np.array(target_permutations)
+        shared_targ = np.ndarray(targ_shape, dtype=targ_dtype, buffer=targ_shm.buf)
+        for j in range(n_targets):
+            shared_targ[j] = bcp(target_bins[j], n_permutations)
 
-    with mp.Pool(processes=mp.cpu_count()) as pool:
-        permuted_mi_scores = pool.starmap(
-            mutual_info,
-            [
-                (features[feature_field], permuted_target, nbins_feature, nbins_target)
-                for permuted_targets in target_permutations
-                for permuted_target in permuted_targets
-                for feature_field in feature_fields
-            ]
-        )
+        with mp.Pool(
+            processes=mp.cpu_count(),
+            initializer=_attach_shared_bins,
+            initargs=(
+                feat_shm.name, feature_bins.shape, feat_dtype,
+                targ_shm.name, targ_shape, targ_dtype,
+                nbins_feature, nbins_target
+            )
+        ) as pool:
+            permuted_mi_scores = pool.starmap(
+                _permuted_mi_task,
+                [
+                    (i, j, k)
+                    for i in range(n_features)
+                    for j in range(n_targets)
+                    for k in range(n_permutations)
+                ]
+            )
+    finally:
+        feat_shm.close()
+        feat_shm.unlink()
+        targ_shm.close()
+        targ_shm.unlink()
 
-    permuted_mi_scores = np.array(permuted_mi_scores).reshape(len(feature_fields), len(target_fields), n_permutations)
+    permuted_mi_scores = np.array(permuted_mi_scores).reshape(n_features, n_targets, n_permutations)
 
     # Calculate p-values
-    solo_p_values = np.mean(permuted_mi_scores >= original_mi_scores[:, None, None], axis=2)
-    unbiased_p_values = (np.sum(permuted_mi_scores >= original_mi_scores[:, None, None], axis=2) + 1) / (n_permutations + 1)
+    solo_p_values = np.mean(permuted_mi_scores >= original_mi_scores[:, :, None], axis=2)
+    unbiased_p_values = (np.sum(permuted_mi_scores >= original_mi_scores[:, :, None], axis=2) + 1) / (n_permutations + 1)
 
     # Print results
     print("## Mutual Information Report")
@@ -78,8 +156,7 @@ def generate_mi_report(
 
     for (feature_field, target_field), mi_score, solo_p, unbiased_p in zip(
             [(f, t) for f in feature_fields for t in target_fields],
-            original_mi_scores,
+            original_mi_scores.flatten(),
             solo_p_values.flatten(),
             unbiased_p_values.flatten()):
         print(f"| {feature_field:<18} | {target_field:<18} | {mi_score:<19.4f} | {solo_p:<19.4f} | {unbiased_p:<19.4f} |")
-
@@ -9,12 +9,22 @@ def bcp(target: np.ndarray, n_permutations: int) -> np.ndarray:
     - n_permutations (int): Number of permutations to generate.
 
     Returns:
-    - np.ndarray: An array of permuted target arrays.
+    - np.ndarray: Array of permuted target arrays.
     """
     n = len(target)
-    target_permutations = np.empty((n_permutations, n), dtype=target.dtype)
-    for i in range(n_permutations):
-        shift = np.random.randint(0, n)  # Generate a single shift value
-        target_permutations[i] = np.roll(target, shift)
-    
-    return target_permutations
+
+    # Double the target so every cyclic rotation is a contiguous slice of
+    # one O(n) buffer; as_strided views all n rotations over that buffer
+    # without copying.
+    doubled = np.ascontiguousarray(np.concatenate([target, target]))
+    stride = doubled.strides[0]
+    rotations = np.lib.stride_tricks.as_strided(
+        doubled, shape=(n, n), strides=(stride, stride)
+    )
+
+    # Row k of `rotations` is target cycled by k, so uniform random rows give
+    # the same distribution as np.roll with uniform random shifts. The fancy
+    # indexing gathers the selected rows into a fresh owned array — only the
+    # n_permutations requested rows are ever materialized.
+    shifts = np.random.randint(0, n, size=n_permutations)
+    return rotations[shifts]
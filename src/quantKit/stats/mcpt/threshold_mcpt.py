@@ -118,11 +118,20 @@ def opt_MCPT(
     )
     
     original_best_pf = max(pf_high, pf_low)
-    
+
+    # Precompute one index permutation per replication up front so the inner
+    # loop is a pure gather into the reused work_permute buffer instead of an
+    # in-place element-by-element shuffle. int32 indices halve the matrix
+    # footprint; n is far below 2^31.
+    if nreps > 1:
+        perm_idx = np.argsort(
+            np.random.random((nreps - 1, n)), axis=1
+        ).astype(np.int32)
+
     for irep in range(1, nreps):
-        # Shuffle the work_permute array
-        np.random.shuffle(work_permute)
-        
+        # Gather the permuted returns into the work_permute buffer
+        np.take(returns, perm_idx[irep - 1], out=work_permute)
+
         # Optimize thresholds with the shuffled returns
         pf_all_rep, high_thresh_rep, pf_high_rep, low_thresh_rep, pf_low_rep = opt_thresh(
             min_cases_percent=(min_kept / n) * 100,
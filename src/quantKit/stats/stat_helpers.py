@@ -6,6 +6,7 @@ Table of Contents:
     - compute_serial_correlated_break(values: np.ndarray, ncases: int, min_recent: int, max_recent: int, lag: int) -> tuple
     - fast_exponential_smoothing(values: np.ndarray) -> float
     - mutual_info(feature: np.ndarray, target: np.ndarray, nbins_feature: int = 10, nbins_target: int = 10) -> float
+    - mutual_info_kernel(feature_bins: np.ndarray, target_bins: np.ndarray, nbins_feature: int, nbins_target: int) -> float
     - normal_cdf(z: float) -> float
     - populate_contingency_matrix(feature: np.ndarray, target: np.ndarray, nbins_feature: int, nbins_target: int) -> tuple
     - relative_entropy(p: np.ndarray, q: np.ndarray) -> float
@@ -13,10 +14,57 @@ Table of Contents:
 
 """
 import numpy as np
+from numba import njit, prange
 
 #--------------------
 # Average True Range
 #--------------------
+@njit(cache=True, fastmath=True)
+def _atr_kernel(
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    period: int,
+    use_log: bool,
+    out: np.ndarray
+) -> None:
+    # One fused pass: log returns, the three true-range candidates, their max,
+    # and a rolling mean via a period-element ring buffer — no full-length
+    # temporaries. Windows match the cumsum formulation, including the final
+    # bar whose window holds only period - 1 true ranges.
+    n = high_prices.shape[0]
+    out[:] = np.nan
+    if n <= period:
+        return
+
+    tr_buf = np.empty(period)
+    running_sum = 0.0
+    for k in range(n - 1):
+        if use_log:
+            high_log = np.log(high_prices[k + 1] / high_prices[k])
+            low_log = np.log(low_prices[k + 1] / low_prices[k])
+            close_log = np.log(close_prices[k + 1] / close_prices[k])
+            tr1 = high_log - low_log
+            tr2 = abs(high_log - close_log)
+            tr3 = abs(low_log - close_log)
+        else:
+            tr1 = high_prices[k + 1] - low_prices[k + 1]
+            tr2 = abs(high_prices[k + 1] - close_prices[k])
+            tr3 = abs(low_prices[k + 1] - close_prices[k])
+        tr = max(tr1, tr2, tr3)
+
+        slot = k % period
+        if k >= period:
+            running_sum -= tr_buf[slot]
+        tr_buf[slot] = tr
+        running_sum += tr
+        if k >= period:
+            out[k] = running_sum / period
+
+    # Final bar: drop the oldest true range from the trailing window
+    running_sum -= tr_buf[(n - 1 - period) % period]
+    out[n - 1] = running_sum / (period - 1)
+
 def atr(
         high_prices: np.ndarray, 
         low_prices: np.ndarray, 
@@ -41,30 +89,33 @@ def atr(
     Returns:
     - np.ndarray: An array of ATR values for the entire series, with NaN for the initial period.
     """
-    if use_log:
-        high_log = np.log(high_prices[1:] / high_prices[:-1])
-        low_log = np.log(low_prices[1:] / low_prices[:-1])
-        close_log = np.log(close_prices[1:] / close_prices[:-1])
-
-        tr1 = high_log - low_log
-        tr2 = np.abs(high_log - close_log)
-        tr3 = np.abs(low_log - close_log)
-    else:
-        tr1 = high_prices[1:] - low_prices[1:]
-        tr2 = np.abs(high_prices[1:] - close_prices[:-1])
-        tr3 = np.abs(low_prices[1:] - close_prices[:-1])
-
-    true_ranges = np.maximum(np.maximum(tr1, tr2), tr3)
-
-    atr_values = np.full_like(high_prices, np.nan)
-    for i in range(period, len(high_prices)):
-        atr_values[i] = np.mean(true_ranges[i - period + 1:i + 1])
-
+    atr_values = np.empty_like(high_prices)
+    _atr_kernel(high_prices, low_prices, close_prices, period, use_log, atr_values)
     return atr_values
 
 # ---------------------------------------------
 # Serial-Correlated Mean Break Test Function
 # ---------------------------------------------
+@njit(cache=True)
+def _average_ranks(sorted_values: np.ndarray) -> tuple:
+    # Assign tie-averaged ranks over an already-sorted array and accumulate
+    # the Mann-Whitney tie correction in the same walk.
+    n = sorted_values.shape[0]
+    ranks = np.empty(n, dtype=np.float64)
+    tie_correction = 0.0
+    i = 0
+    while i < n:
+        start = i
+        while i < n - 1 and sorted_values[i] == sorted_values[i + 1]:
+            i += 1
+        i += 1
+        ntied = i - start
+        tie_correction += ntied ** 3 - ntied
+        rank = start + (i - start - 1) / 2.0 + 1
+        for j in range(start, i):
+            ranks[j] = rank
+    return ranks, tie_correction
+
 def compute_serial_correlated_break(
     values: np.ndarray, 
     ncases: int, 
@@ -93,6 +144,20 @@ def compute_serial_correlated_break(
         - ibreak (int): The boundary (in terms of number of observations from the start of the series) at which the maximum U statistic was observed,
                       suggesting the most likely position for a mean break.
     """
+    # Every boundary tested below splits the same combined array (the first
+    # ncases values), so the sort, tie correction, and tie-averaged ranks are
+    # identical across iterations. Sort once, cumulate the per-position ranks,
+    # and each boundary's rank sum R becomes a single prefix-sum lookup.
+    data = values[:ncases]
+    order = np.argsort(data)
+    ranks_sorted, tie_correction = _average_ranks(data[order])
+    ranks = np.empty(ncases, dtype=np.float64)
+    ranks[order] = ranks_sorted
+    rank_cumsum = np.concatenate(([0.0], np.cumsum(ranks)))
+
+    dn = float(ncases)
+    term2 = (dn**3 - dn - tie_correction) / 12.0
+
     max_crit = -np.inf
     ibreak = -1
     for offset in range(lag + 1):
@@ -103,35 +168,53 @@ def compute_serial_correlated_break(
             n2 = ncases - n1
             if n2 < 1:
                 continue
-            x1 = values[:n1]
-            x2 = values[n1:n1+n2]
-            u_stat, crit = u_test(n1, x1, n2, x2)
+            # Same U and z as u_test(n1, values[:n1], n2, values[n1:]), but
+            # from the precomputed rank prefix sums in O(1).
+            R = rank_cumsum[n1]
+            U = n1 * n2 + 0.5 * (n1 * (n1 + 1.0)) - R
+            term1 = n1 * n2 / (dn * (dn - 1.0))
+            crit = (0.5 * n1 * n2 - U) / np.sqrt(term1 * term2)
             if abs(crit) > max_crit:
                 max_crit = abs(crit)
                 ibreak = nrecent
 
     return max_crit, ibreak
 
+@njit(cache=True, fastmath=True)
+def _ses_kernel(values: np.ndarray, alpha: float, out: np.ndarray) -> None:
+    # Scalar recurrence compiled to one fused multiply-add per element
+    out[0] = values[0]
+    for i in range(1, values.shape[0]):
+        out[i] = alpha * values[i] + (1.0 - alpha) * out[i - 1]
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _ses_kernel_2d(values: np.ndarray, alpha: float, out: np.ndarray) -> None:
+    # Batch variant: smooth each row independently in parallel
+    for row in prange(values.shape[0]):
+        out[row, 0] = values[row, 0]
+        for i in range(1, values.shape[1]):
+            out[row, i] = alpha * values[row, i] + (1.0 - alpha) * out[row, i - 1]
+
 def fast_exponential_smoothing(
-        values: np.ndarray, 
+        values: np.ndarray,
         alpha: float = 0.33333333) -> np.ndarray:
     """
     Apply exponential smoothing to an array of values.
     This is not an EMA, but instead a simple exponential smoothing that applies to an entire array.
 
     Parameters:
-    - values (np.ndarray): Array of values to smooth.
+    - values (np.ndarray): 1D array of values to smooth, or a 2D array
+      whose rows are smoothed independently (in parallel).
     - alpha (float): Smoothing factor (default is 0.33333333).
 
     Returns:
-    - np.ndarray: Array of smoothed values.
+    - np.ndarray: Array of smoothed values, same shape as the input.
     """
-    smoothed_values = np.zeros_like(values)
-    smoothed_values[0] = values[0]
-
-    for i in range(1, len(values)):
-        smoothed_values[i] = alpha * values[i] + (1 - alpha) * smoothed_values[i - 1]
-
+    smoothed_values = np.empty_like(values)
+    if values.ndim == 2:
+        _ses_kernel_2d(values, alpha, smoothed_values)
+    else:
+        _ses_kernel(values, alpha, smoothed_values)
     return smoothed_values
 
 # ---------------------------------------------
@@ -160,34 +243,147 @@ def mutual_info(
 
     feature = feature.flatten()
     target = target.flatten()
-    c_xy, c_feature, c_target = populate_contingency_matrix(
-        feature, target, nbins_feature, nbins_target
-    )
 
-    p_xy = c_xy / np.sum(c_xy)
-    p_feature = c_feature / np.sum(c_feature)
-    p_target = c_target / np.sum(c_target)
+    return _mi(feature, target, nbins_feature, nbins_target)
+
+@njit(cache=True, fastmath=True)
+def _mi(
+    feature: np.ndarray,
+    target: np.ndarray,
+    nbins_feature: int,
+    nbins_target: int
+) -> float:
+    # Fused binning + histogram + MI: one pass for min/max, one pass filling
+    # the joint counts, then a walk over the small histogram. No per-sample
+    # temporaries or probability matrices are materialized.
+    n = feature.shape[0]
+
+    xmin = feature[0]
+    xmax = feature[0]
+    ymin = target[0]
+    ymax = target[0]
+    for i in range(1, n):
+        if feature[i] < xmin:
+            xmin = feature[i]
+        elif feature[i] > xmax:
+            xmax = feature[i]
+        if target[i] < ymin:
+            ymin = target[i]
+        elif target[i] > ymax:
+            ymax = target[i]
+
+    # Same equal-width binning as populate_contingency_matrix
+    xfactor = nbins_feature / (xmax - xmin + 1.e-60)
+    yfactor = nbins_target / (ymax - ymin + 1.e-60)
+
+    c_xy = np.zeros(nbins_feature * nbins_target, dtype=np.int64)
+    for i in range(n):
+        ix = int((feature[i] - xmin) * xfactor)
+        if ix >= nbins_feature:
+            ix = nbins_feature - 1
+        iy = int((target[i] - ymin) * yfactor)
+        if iy >= nbins_target:
+            iy = nbins_target - 1
+        c_xy[ix * nbins_target + iy] += 1
+
+    c_feature = np.zeros(nbins_feature, dtype=np.int64)
+    c_target = np.zeros(nbins_target, dtype=np.int64)
+    for i in range(nbins_feature):
+        for j in range(nbins_target):
+            count = c_xy[i * nbins_target + j]
+            c_feature[i] += count
+            c_target[j] += count
+
+    MI = 0.0
+    for i in range(nbins_feature):
+        for j in range(nbins_target):
+            count = c_xy[i * nbins_target + j]
+            if count > 0:
+                p_xy = count / n
+                p_feature = c_feature[i] / n
+                p_target = c_target[j] / n
+                MI += p_xy * np.log(p_xy / (p_feature * p_target))
+
+    return MI
+
+@njit(cache=True, fastmath=True)
+def mutual_info_kernel(
+    feature_bins: np.ndarray,
+    target_bins: np.ndarray,
+    nbins_feature: int,
+    nbins_target: int
+) -> float:
+    """
+    Fused joint-histogram and mutual information kernel over pre-binned data.
 
-    # Avoiding log(0) by adding a small epsilon where p_xy or the denominator is zero
-    p_xy_safe = np.where(p_xy > 0, p_xy, 1e-10)
-    denominator = p_feature[:, None] * p_target[None, :]
-    denominator_safe = np.where(denominator > 0, denominator, 1e-10)
+    Streams the bin index arrays once, accumulating the joint histogram in a
+    small cache-resident buffer, then computes MI directly from the counts
+    without materializing probability matrices.
 
-    # Vectorized calculation of mutual information
-    MI = np.sum(p_xy_safe * np.log(p_xy_safe / denominator_safe))
+    Parameters:
+    - feature_bins (np.ndarray): Integer bin index per sample for the feature.
+    - target_bins (np.ndarray): Integer bin index per sample for the target.
+    - nbins_feature (int): Number of bins for the feature.
+    - nbins_target (int): Number of bins for the target.
+
+    Returns:
+    - float: Calculated mutual information value.
+    """
+    n = feature_bins.shape[0]
+
+    c_xy = np.zeros(nbins_feature * nbins_target, dtype=np.int64)
+    for i in range(n):
+        c_xy[feature_bins[i] * nbins_target + target_bins[i]] += 1
+
+    c_feature = np.zeros(nbins_feature, dtype=np.int64)
+    c_target = np.zeros(nbins_target, dtype=np.int64)
+    for i in range(nbins_feature):
+        for j in range(nbins_target):
+            count = c_xy[i * nbins_target + j]
+            c_feature[i] += count
+            c_target[j] += count
+
+    MI = 0.0
+    for i in range(nbins_feature):
+        for j in range(nbins_target):
+            count = c_xy[i * nbins_target + j]
+            if count > 0:
+                p_xy = count / n
+                p_feature = c_feature[i] / n
+                p_target = c_target[j] / n
+                MI += p_xy * np.log(p_xy / (p_feature * p_target))
 
     return MI
 
-def normal_cdf(z: float) -> float:
+def normal_cdf(z):
     """
     Calculate the Normal Cumulative Distribution Function (CDF).
 
+    Accepts either a scalar or an array of z values; the Abramowitz-Stegun
+    polynomial is elementwise, so arrays are evaluated in one vectorized pass.
+
     Parameters:
-    - z (float): The input value for which to calculate the CDF.
+    - z (float or np.ndarray): The input value(s) for which to calculate the CDF.
 
     Returns:
-    - float: The calculated CDF value.
+    - float or np.ndarray: The calculated CDF value(s); a float for scalar input.
     """
+    z = np.asarray(z, dtype=np.float64)
+    zz = np.abs(z)
+    pdf = np.exp(-0.5 * zz * zz) / np.sqrt(2.0 * np.pi)
+    t = 1.0 / (1.0 + zz * 0.2316419)
+    poly = ((((1.330274429 * t - 1.821255978) * t + 1.781477937) * t -
+             0.356563782) * t + 0.319381530) * t
+    cdf = np.where(z > 0.0, 1.0 - pdf * poly, pdf * poly)
+    if cdf.ndim == 0:
+        return float(cdf)
+    return cdf
+
+@njit(cache=True, fastmath=True)
+def _normal_cdf_scalar(z: float) -> float:
+    # Scalar twin of normal_cdf for per-element callers (CMMA's bar loop)
+    # and numba-compiled code; avoids the asarray/where wrapping that the
+    # vectorized version pays on every call
     zz = abs(z)
     pdf = np.exp(-0.5 * zz * zz) / np.sqrt(2.0 * np.pi)
     t = 1.0 / (1.0 + zz * 0.2316419)
@@ -222,35 +418,26 @@ def populate_contingency_matrix(
     if not isinstance(feature, np.ndarray) or not isinstance(target, np.ndarray):
         raise TypeError("'feature' and 'target' must both be numpy arrays.")
 
-    bins_feature = np.linspace(np.min(feature), np.max(feature), nbins_feature + 1)
-    bins_target = np.linspace(np.min(target), np.max(target), nbins_target + 1)
-
-    c_xy = np.zeros((nbins_feature, nbins_target), dtype=np.float64)
-    c_feature = np.zeros(nbins_feature, dtype=np.float64)
-    c_target = np.zeros(nbins_target, dtype=np.float64)
-
-    for i in range(len(feature)):
-        value = feature[i]
-        target_value = target[i]
-
-        idx_feature = np.searchsorted(bins_feature, value, side='right') - 1
-        idx_target = np.searchsorted(bins_target, target_value, side='right') - 1
-
-        # Ensure idx_feature is within valid range
-        if idx_feature < 0:
-            idx_feature = 0
-        elif idx_feature >= nbins_feature:
-            idx_feature = nbins_feature - 1
-
-        # Ensure idx_target is within valid range
-        if idx_target < 0:
-            idx_target = 0
-        elif idx_target >= nbins_target:
-            idx_target = nbins_target - 1
+    # Equal-width bin indices computed for all samples at once
+    xmin, xmax = np.min(feature), np.max(feature)
+    ymin, ymax = np.min(target), np.max(target)
+    idx_feature = np.clip(
+        ((feature - xmin) * (nbins_feature / (xmax - xmin + 1.e-60))).astype(np.intp),
+        0, nbins_feature - 1
+    )
+    idx_target = np.clip(
+        ((target - ymin) * (nbins_target / (ymax - ymin + 1.e-60))).astype(np.intp),
+        0, nbins_target - 1
+    )
 
-        c_feature[idx_feature] += 1
-        c_target[idx_target] += 1   
-        c_xy[idx_feature, idx_target] += 1
+    # Accumulate the joint counts with a single bincount on a flat index;
+    # the marginals are just row/column sums of the contingency matrix.
+    flat = idx_feature * nbins_target + idx_target
+    c_xy = np.bincount(
+        flat, minlength=nbins_feature * nbins_target
+    ).reshape(nbins_feature, nbins_target).astype(np.float64)
+    c_feature = c_xy.sum(axis=1)
+    c_target = c_xy.sum(axis=0)
 
     return c_xy, c_feature, c_target
 
@@ -287,21 +474,13 @@ def relative_entropy(values: np.ndarray) -> float:
     
     # Vectorized binning
     bin_indices = np.floor(factor * (values - xmin)).astype(int)
-    
+
     # Ensure indices are within valid range (important for edge cases)
     bin_indices = np.clip(bin_indices, 0, nbins - 1)
-    
-    # Count values in each bin using numpy's bincount
-    if len(bin_indices) > 0:  # Protect against empty arrays
-        counts = np.bincount(bin_indices, minlength=nbins)
-        if len(counts) < nbins:
-            # If bincount returns fewer than nbins values, pad with zeros
-            full_counts = np.zeros(nbins, dtype=int)
-            full_counts[:len(counts)] = counts
-            counts = full_counts
-    else:
-        counts = np.zeros(nbins, dtype=int)
-    
+
+    # Count values in each bin in one pass; minlength guarantees nbins entries
+    counts = np.bincount(bin_indices, minlength=nbins)
+
     # Vectorized entropy calculation
     # Only consider non-zero probabilities
     p = counts[counts > 0] / n
@@ -313,6 +492,27 @@ def relative_entropy(values: np.ndarray) -> float:
 # ---------------------------------------------
 # Mann-Whitney U Test Function
 # ---------------------------------------------
+@njit(cache=True)
+def _rank_with_ties(sorted_combined: np.ndarray, sorted_group: np.ndarray) -> tuple:
+    # Walk the sorted data once, assigning tied ranks and accumulating the
+    # group-1 rank sum R directly so the ranks array is never materialized.
+    n = sorted_combined.shape[0]
+    R = 0.0
+    tie_correction = 0.0
+    i = 0
+    while i < n:
+        start = i
+        while i < n - 1 and sorted_combined[i] == sorted_combined[i + 1]:
+            i += 1
+        i += 1
+        ntied = i - start
+        tie_correction += ntied ** 3 - ntied
+        rank = start + (i - start - 1) / 2.0 + 1
+        for j in range(start, i):
+            if sorted_group[j] == 1:
+                R += rank
+    return R, tie_correction
+
 def u_test(n1: int, x1: np.ndarray, n2: int, x2: np.ndarray) -> tuple:
     """
     Mann-Whitney U-test.
@@ -345,22 +545,10 @@ def u_test(n1: int, x1: np.ndarray, n2: int, x2: np.ndarray) -> tuple:
     sorted_combined = combined[indices]
     sorted_group = group[indices]
 
-    # Compute ranks and tie correction.
-    ranks = np.empty(n1 + n2, dtype=np.float64)
-    tie_correction = 0.0
-    i = 0
-    while i < n1 + n2:
-        start = i
-        while i < n1 + n2 - 1 and sorted_combined[i] == sorted_combined[i + 1]:
-            i += 1
-        i += 1
-        ntied = i - start
-        tie_correction += ntied ** 3 - ntied
-        for j in range(start, i):
-            ranks[j] = start + (i - start - 1) / 2.0 + 1
+    # Rank walk and tie correction in a compiled kernel.
+    R, tie_correction = _rank_with_ties(sorted_combined, sorted_group)
 
     # Compute the U statistic.
-    R = np.sum(ranks[sorted_group == 1])
     U = n1 * n2 + 0.5 * (n1 * (n1 + 1.0)) - R
 
     # Compute the normal approximation.
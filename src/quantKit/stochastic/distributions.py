@@ -17,7 +17,8 @@ Size = Union[int, Tuple[int, ...]]
 
 @njit
 def _poisson_one(lam: float, u: float) -> int:
-    # Devroye's sequential-search Poisson for a single uniform variate u
+    # Devroye's sequential-search Poisson for a single uniform variate u.
+    # Scalar fallback; the batch path in poisson_rvs vectorizes this search.
     x = 0
     p = np.exp(-lam)
     s = p
@@ -31,6 +32,9 @@ def _poisson_one(lam: float, u: float) -> int:
 def uniform_rvs(rng: Generator, size: Size) -> np.ndarray:
     """
     Generate Uniform[0,1) random variates.
+
+    The returned array is freshly drawn and owned by the caller, who may
+    mutate it in place.
     """
     return rng.random(size)
 
@@ -39,32 +43,108 @@ def exponential_rvs(rng: Generator, lam: float, size: Size) -> np.ndarray:
     """
     Generate exponential variates with rate `lam` via the inverse-transform method:
       X = -ln(1 - U) / lam
+
+    The transform runs entirely in the RNG output buffer, so no temporaries
+    are allocated beyond the returned array.
     """
     u = rng.random(size)
-    return -np.log1p(-u) / lam
+    np.negative(u, out=u)
+    np.log1p(u, out=u)
+    u *= -1.0 / lam
+    return u
 
 
 def poisson_rvs(rng: Generator, lam: float, size: Size) -> np.ndarray:
     """
-    Generate Poisson(λ) variates using a JIT-compiled sequential-search for the inner loop.
+    Generate Poisson(λ) variates.
+
+    Small rates use a batch-vectorized Knuth sequential search that advances
+    every still-unresolved variate one step per vector operation. Large rates
+    delegate to `rng.poisson`, whose PTRS sampler is faster once the expected
+    number of search steps grows with λ.
     """
+    if lam >= 30.0:
+        return rng.poisson(lam, size)
+
     u = rng.random(size)
     flat_u = u.ravel()
-    out = np.empty_like(flat_u, dtype=np.int64)
-    for i in range(flat_u.size):
-        out[i] = _poisson_one(lam, flat_u[i])
-    return out.reshape(u.shape)
+    n = flat_u.size
+
+    x = np.zeros(n, dtype=np.int64)
+    p = np.full(n, np.exp(-lam))
+    s = p.copy()
+    active = flat_u > s
+    while active.any():
+        x[active] += 1
+        p[active] *= lam / x[active]
+        s[active] += p[active]
+        active = flat_u > s
+    return x.reshape(u.shape)
 
 
 def discrete_rvs(rng: Generator, probabilities: np.ndarray, size: Size) -> np.ndarray:
     """
     Generate discrete variates over indices [0..len(probabilities)-1] via inverse-transform.
+
+    For repeated sampling from the same distribution, build an `AliasSampler`
+    once instead — it amortizes the table setup and draws in O(1) per variate.
     """
     cum = np.cumsum(probabilities)
     u = rng.random(size)
     return np.searchsorted(cum, u)
 
 
+class AliasSampler:
+    """
+    Walker's alias-method sampler for a fixed discrete distribution.
+
+    Builds the probability/alias tables once in O(k), then draws variates in
+    O(1) each (two uniform draws, no search), which beats the cumsum +
+    searchsorted path in `discrete_rvs` whenever the same distribution is
+    sampled repeatedly.
+    """
+
+    def __init__(self, probabilities: np.ndarray):
+        p = np.asarray(probabilities, dtype=np.float64)
+        p = p / p.sum()
+        k = p.size
+
+        prob = np.empty(k, dtype=np.float64)
+        alias = np.zeros(k, dtype=np.int64)
+
+        # Split the scaled probabilities into under- and over-full cells and
+        # pair them off: each cell holds at most one alias.
+        scaled = p * k
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        for i in large:
+            prob[i] = 1.0
+        for i in small:
+            prob[i] = 1.0
+
+        self.k = k
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self, rng: Generator, size: Size) -> np.ndarray:
+        """
+        Draw variates over indices [0..k-1] from the prepared tables.
+        """
+        i = rng.integers(self.k, size=size)
+        r = rng.random(size)
+        return np.where(r < self.prob[i], i, self.alias[i])
+
+
 def inverse_transform_rvs(
     rng: Generator,
     cdf_inverse: Callable[[np.ndarray], np.ndarray],
@@ -94,16 +174,17 @@ def rejection_rvs(
       - C: envelope constant (pdf <= C * proposal_pdf)
     Returns exactly `size` accepted samples.
     """
-    samples = []
-    needed = size
-    while needed > 0:
-        n = int(needed * oversample_factor)
+    # Accepted batches are written straight into a preallocated output via a
+    # fill cursor, avoiding the list-append + final concatenate copy.
+    out = np.empty(size, dtype=np.float64)
+    filled = 0
+    while filled < size:
+        n = int((size - filled) * oversample_factor)
         x = proposal_sampler(n)
         u = rng.random(n)
-        accept = u < (pdf(x) / (C * proposal_pdf(x)))
-        accepted = x[accept]
-        if accepted.size:
-            samples.append(accepted)
-            needed -= accepted.size
-    result = np.concatenate(samples)
-    return result[:size]
+        # u * C * proposal_pdf < pdf is the same acceptance test without the division
+        accepted = x[u * (C * proposal_pdf(x)) < pdf(x)]
+        take = min(accepted.size, size - filled)
+        out[filled:filled + take] = accepted[:take]
+        filled += take
+    return out
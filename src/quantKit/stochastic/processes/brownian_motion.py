@@ -28,12 +28,14 @@ class BrownianMotionProcess:
           paths: ndarray, shape (n_paths, n_steps+1)
           increments: ndarray, shape (n_paths, n_steps)
         """
-        # normal increments: mean mu*dt, std sigma*sqrt(dt)
-        increments = self.rng.normal(
-            loc=self.mu * self.dt,
-            scale=self.sigma * np.sqrt(self.dt),
-            size=(self.n_paths, self.n_steps)
-        )
+        # normal increments: mean mu*dt, std sigma*sqrt(dt).
+        # standard_normal(out=...) fills the buffer directly (no per-call
+        # loc/scale branching or extra allocation); scale and shift in place.
+        increments = np.empty((self.n_paths, self.n_steps))
+        self.rng.standard_normal(out=increments)
+        increments *= self.sigma * np.sqrt(self.dt)
+        increments += self.mu * self.dt
         paths = np.zeros((self.n_paths, self.n_steps + 1), dtype=increments.dtype)
-        paths[:, 1:] = np.cumsum(increments, axis=1)
+        # cumsum straight into the paths slice — no intermediate buffer
+        np.cumsum(increments, axis=1, out=paths[:, 1:])
         return paths, increments
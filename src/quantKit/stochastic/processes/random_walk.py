@@ -20,11 +20,19 @@ class RandomWalkProcess:
           paths: ndarray, shape (n_paths, n_steps+1)
           increments: ndarray, shape (n_paths, n_steps)
         """
-        # generate ±1 increments
-        increments = self.rng.choice([-1, 1], size=(self.n_paths, self.n_steps))
+        # generate ±1 increments from packed random bits: one RNG byte yields
+        # eight sign bits, far cheaper than drawing a float per increment
+        n_total = self.n_paths * self.n_steps
+        n_bytes = (n_total + 7) // 8
+        bits = np.unpackbits(
+            np.frombuffer(self.rng.bytes(n_bytes), dtype=np.uint8), count=n_total
+        )
+        increments = bits.astype(np.int8).reshape(self.n_paths, self.n_steps)
+        increments <<= 1
+        increments -= 1  # map {0, 1} -> {-1, +1} in place
         scaled_inc = increments * np.sqrt(self.dt)
         # initialize paths array with starting value 0
         paths = np.zeros((self.n_paths, self.n_steps + 1), dtype=scaled_inc.dtype)
-        # cumulative sum of scaled increments
-        paths[:, 1:] = np.cumsum(scaled_inc, axis=1)
+        # cumulative sum of scaled increments straight into the paths slice
+        np.cumsum(scaled_inc, axis=1, out=paths[:, 1:])
         return paths, increments
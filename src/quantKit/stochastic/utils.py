@@ -1,6 +1,6 @@
-"""quantKit.stochastics.utils
+"""quantKit.stochastic.utils
 
-Pure-math utility and helper functions for the stochastics package in quantKit.
+Pure-math utility and helper functions for the stochastic package in quantKit.
 """
 
 __all__ = [
@@ -9,30 +9,38 @@ __all__ = [
 ]
 
 import numpy as np
+from numba import njit
 
-def normal_cdf(z: float) -> float:
+def normal_cdf(z):
     """
     Calculate the Normal Cumulative Distribution Function (CDF).
 
+    Accepts a scalar or an array of z values; the polynomial approximation is
+    elementwise, so arrays are evaluated in a single vectorized pass.
+
     Parameters:
-        z (float): The input value for which to calculate the CDF.
+        z (float or np.ndarray): The input value(s) for which to calculate the CDF.
 
     Returns:
-        float: The calculated CDF value.
+        float or np.ndarray: The calculated CDF value(s); a float for scalar input.
 
     Examples:
-        >>> from quantKit.stochastics.utils import normal_cdf
+        >>> from quantKit.stochastic.utils import normal_cdf
         >>> normal_cdf(0.0)
         0.5
         >>> normal_cdf(1.96)
         0.9750021048517795
     """
-    zz = abs(z)
+    z = np.asarray(z, dtype=np.float64)
+    zz = np.abs(z)
     pdf = np.exp(-0.5 * zz * zz) / np.sqrt(2.0 * np.pi)
     t = 1.0 / (1.0 + zz * 0.2316419)
     poly = ((((1.330274429 * t - 1.821255978) * t + 1.781477937) * t -
              0.356563782) * t + 0.319381530) * t
-    return 1.0 - pdf * poly if z > 0.0 else pdf * poly
+    cdf = np.where(z > 0.0, 1.0 - pdf * poly, pdf * poly)
+    if cdf.ndim == 0:
+        return float(cdf)
+    return cdf
 
 def quadratic_variation(path: np.ndarray) -> float:
     """
@@ -45,11 +53,25 @@ def quadratic_variation(path: np.ndarray) -> float:
         float: sum of squared increments
     
     Examples:
-        >>> from quantKit.stochastics.utils import quadratic_variation
+        >>> from quantKit.stochastic.utils import quadratic_variation
         >>> import numpy as np
         >>> path = np.array([0.0, 1.0, 0.5, 1.5])
         >>> quadratic_variation(path)
-        1.75
+        2.25
     """
+    if path.shape[0] > 4096:
+        # Single fused pass, no diffs temporary
+        return _quadratic_variation_kernel(path)
+    # Dot product of the increments with themselves — no squared temporary
     diffs = np.diff(path)
-    return np.sum(diffs**2)
+    return float(diffs @ diffs)
+
+@njit(cache=True, fastmath=True)
+def _quadratic_variation_kernel(path: np.ndarray) -> float:
+    # Walks the path once, accumulating squared increments without
+    # materializing the diff array; pays off on long paths.
+    acc = 0.0
+    for i in range(path.shape[0] - 1):
+        d = path[i + 1] - path[i]
+        acc += d * d
+    return acc
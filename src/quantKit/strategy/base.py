@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import asdict
+from dataclasses import fields, replace
 from typing import Dict, Any, List
 from quantKit.data.container import DataContainer
 from .settings import StrategySettings, DEFAULT_STRATEGY_SETTINGS
@@ -10,14 +10,16 @@ class Strategy(ABC):
     Abstract base class for trading strategies.
     """
     def __init__(self):
-        # merge defaults + overrides
+        # replace() only touches overridden fields — no intermediate dicts —
+        # and still runs __post_init__ for the intraday_start_date default.
+        # Stored as _settings so the settings() method is not shadowed.
         overrides = self.settings() or {}
-        merged = {**asdict(DEFAULT_STRATEGY_SETTINGS), **overrides}
-        self.settings = StrategySettings(**merged)
+        self._settings = replace(DEFAULT_STRATEGY_SETTINGS, **overrides)
 
-        # now validate required fields
-        missing = [f for f in ("start_date","end_date","validation_days") 
-                   if getattr(self.settings, f) is None]
+        # now validate required fields (intraday_start_date is derived)
+        missing = [f.name for f in fields(self._settings)
+                   if f.name != "intraday_start_date"
+                   and getattr(self._settings, f.name) is None]
         if missing:
             raise ValueError(
                 f"Missing required settings: {', '.join(missing)}. "
@@ -26,7 +28,7 @@ class Strategy(ABC):
 
     @abstractmethod
     def settings(self) -> Dict[str, Any]:
-       """
+        """
         Return only the fields you wish to override,
         e.g. {'start_date':'2021-01-01','end_date':'2025-04-23'}
         """
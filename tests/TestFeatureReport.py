@@ -1,27 +1,38 @@
 import unittest
 import numpy as np
+import pytest
 from datetime import datetime, timedelta
-from pyQuantTools.reports.FeatureTestReport import run_indicator_tests
+
+# The feature report plots via matplotlib, which is an optional dependency
+pytest.importorskip(
+    "quantKit.reports.FeatureTestReport",
+    reason="requires matplotlib",
+)
+from quantKit.reports.FeatureTestReport import run_indicator_tests
 
 class TestRunIndicatorTests(unittest.TestCase):
     def setUp(self):
         # Generate sample features and target data
-        np.random.seed(42)  # For reproducibility
+        rng = np.random.default_rng(42)  # For reproducibility
         dates = np.array([(datetime.now().date() - timedelta(days=i)).strftime('%d/%m/%Y') for i in range(1000)][::-1])
-        self.features = np.rec.array(
-            [
-                (dates[i], np.random.rand(), np.random.rand(), np.random.rand())
-                for i in range(1000)
-            ],
+
+        # One contiguous draw, sliced column-by-column into the recarrays
+        pool = rng.random((1000, 4))
+        self.features = np.empty(
+            1000,
             dtype=[('Date', 'U10'), ('feature1', 'f8'), ('feature2', 'f8'), ('feature3', 'f8')]
-        )
-        self.target = np.rec.array(
-            [
-                (dates[i], np.random.rand())
-                for i in range(1000)
-            ],
+        ).view(np.recarray)
+        self.features['Date'] = dates
+        self.features['feature1'] = pool[:, 0]
+        self.features['feature2'] = pool[:, 1]
+        self.features['feature3'] = pool[:, 2]
+
+        self.target = np.empty(
+            1000,
             dtype=[('Date', 'U10'), ('target', 'f8')]
-        )
+        ).view(np.recarray)
+        self.target['Date'] = dates
+        self.target['target'] = pool[:, 3]
 
     def test_run_indicator_tests_to_terminal(self):
         # Run the report function (check if it runs without errors)
@@ -1,14 +1,16 @@
 import unittest
 import numpy as np
-from pyQuantTools.math.math_helpers import LogReturns
+from quantKit.math.math_helpers import LogReturns
 
 class TestMathHelpers(unittest.TestCase):
-    def setUp(self):
-        # Example data for testing
-        np.random.seed(42)  # For reproducibility
-        self.values = np.random.rand(1000) + 1  # Avoid zeros for log returns
-        self.small_values = np.random.rand(10) + 1  # Avoid zeros
-        self.nan_values = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+    @classmethod
+    def setUpClass(cls):
+        # Example data for testing, generated once per class since the tests
+        # never mutate these arrays
+        rng = np.random.default_rng(42)  # For reproducibility
+        cls.values = rng.random(1000) + 1  # Avoid zeros for log returns
+        cls.small_values = rng.random(10) + 1  # Avoid zeros
+        cls.nan_values = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
 
     def test_log_returns(self):
         # Test for proper output
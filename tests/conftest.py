@@ -0,0 +1,30 @@
+"""Shared pytest configuration for the quantKit test suite.
+
+The suite is embarrassingly parallel — every module seeds its own
+Generator and builds independent fixtures — so it can be run with
+pytest-xdist:
+
+    pytest -n auto -m "not serial"
+    pytest -m serial
+
+Tests that touch process-global state (e.g. stdout redirection) carry
+the ``serial`` marker. The only such test today is
+TestPlotFeaturesTerminal, and its module currently skips itself (the
+plotext backend and the SPX CSV fixture are not available in this
+tree), so ``pytest -m serial`` runs nothing until those land; the
+marker is registered now so the two-phase invocation is already correct
+when they do.
+
+Modules whose dependencies are missing skip themselves at import time
+(test_schemas.py: quantKit.data.container; TestPlotFeatures.py,
+TestFeatureReport.py: optional plotting backends), so a plain
+``pytest`` run collects cleanly.
+"""
+
+
+def pytest_configure(config):
+    """Register custom markers used by the suite."""
+    config.addinivalue_line(
+        'markers',
+        'serial: test mutates process-global state; run without xdist',
+    )
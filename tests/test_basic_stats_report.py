@@ -1,37 +1,44 @@
 import unittest
 import numpy as np
 import os
+import shutil
 import tempfile
 
 from quantKit.reports.basic_stats_report import generate_basic_stats_report
 
 class TestBasicStatsReport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One temp dir for the whole class — cheaper than creating and
+        # tearing down a directory inside every test method
+        cls.tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
     def setUp(self):
-        # Create a small recarray with two numeric fields
+        # Create a small recarray with two numeric fields, filled per
+        # column instead of from per-row Python tuples
         dtype = [('Feature1', 'f8'), ('Feature2', 'f8')]
-        self.data = np.array([
-            (1.0, 10.0),
-            (2.0, 20.0),
-            (np.nan, 30.0),
-            (4.0, np.nan),
-            (5.0, 50.0),
-        ], dtype=dtype).view(np.recarray)
+        self.data = np.empty(5, dtype=dtype).view(np.recarray)
+        self.data['Feature1'] = [1.0, 2.0, np.nan, 4.0, 5.0]
+        self.data['Feature2'] = [10.0, 20.0, 30.0, np.nan, 50.0]
 
     def test_no_save_runs(self):
         # Should run without error and print to console
         generate_basic_stats_report(self.data)
 
     def test_with_save_creates_csv(self):
-        # Use a temp dir for CSV output
-        with tempfile.TemporaryDirectory() as tmpdir:
-            generate_basic_stats_report(self.data, save_csv=True, csv_dir=tmpdir)
-            files = os.listdir(tmpdir)
-            # Exactly one CSV file
-            self.assertEqual(len(files), 1)
-            self.assertTrue(files[0].endswith('_basic_stats.csv'))
-            # And it’s non-empty
-            path = os.path.join(tmpdir, files[0])
-            self.assertGreater(os.path.getsize(path), 0)
+        # Use the class-level temp dir for CSV output
+        generate_basic_stats_report(self.data, save_csv=True, csv_dir=self.tmpdir)
+        files = os.listdir(self.tmpdir)
+        # Exactly one CSV file
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].endswith('_basic_stats.csv'))
+        # And it’s non-empty
+        path = os.path.join(self.tmpdir, files[0])
+        self.assertGreater(os.path.getsize(path), 0)
     
     
 if __name__ == "__main__":
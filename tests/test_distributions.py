@@ -8,6 +8,7 @@ from quantKit.stochastic.distributions import (
     poisson_rvs,
     discrete_rvs,
     inverse_transform_rvs,
+    AliasSampler,
 )
 
 class TestDistributions(unittest.TestCase):
@@ -41,6 +42,14 @@ class TestDistributions(unittest.TestCase):
         self.assertAlmostEqual(freq[0], 0.2, delta=0.02)
         self.assertAlmostEqual(freq[1], 0.8, delta=0.02)
 
+    def test_alias_sampler_distribution(self):
+        probs = np.array([0.1, 0.3, 0.6])
+        sampler = AliasSampler(probs)
+        x = sampler.sample(self.rng, size=100000)
+        freq = np.bincount(x, minlength=3) / x.size
+        for i, p in enumerate(probs):
+            self.assertAlmostEqual(freq[i], p, delta=0.02)
+
     def test_inverse_transform_rvs_exponential(self):
         inv = lambda u: -np.log1p(-u)  # Exponential(1)
         x = inverse_transform_rvs(self.rng, inv, size=100000)
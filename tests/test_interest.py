@@ -6,14 +6,18 @@ from quantKit.financial.interest import (
     discrete_compound_interest,
     continuous_compound_interest
 )
+from tests._refs import ref_compound
 
 
 class TestInterest(unittest.TestCase):
-    def setUp(self):
-        """Set up test data."""
-        self.principal = np.array([100.0, 1000.0, 5000.0])
-        self.rate = 0.05  # 5% annual rate
-        self.time = np.array([1.0, 2.0, 3.0])
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data once for the class; the arrays are frozen."""
+        cls.principal = np.array([100.0, 1000.0, 5000.0])
+        cls.rate = 0.05  # 5% annual rate
+        cls.time = np.array([1.0, 2.0, 3.0])
+        cls.principal.flags.writeable = False
+        cls.time.flags.writeable = False
 
     def test_simple_interest_basic(self):
         """Test basic simple interest calculation."""
@@ -76,8 +80,9 @@ class TestInterest(unittest.TestCase):
             self.principal, self.rate, self.time, freq=12
         )
         
-        # A = P * (1 + r/m)^(m*t)
-        expected = self.principal * np.power(1 + self.rate/12, 12 * self.time)
+        # A = P * (1 + r/m)^(m*t), recomputed by the fused JIT reference
+        # kernel so the expectation is independent of the production code
+        expected = ref_compound(self.principal, self.rate, self.time, 12.0)
         
         np.testing.assert_array_almost_equal(result, expected, decimal=6)
 
@@ -158,22 +163,19 @@ class TestInterest(unittest.TestCase):
             principal_val, rate_val, time_val
         )
         
-        # Test increasing frequencies approaching continuous
-        frequencies = [1, 4, 12, 52, 365, 8760]  # annual to hourly
-        results = []
-        
-        for freq in frequencies:
-            result = discrete_compound_interest(
-                principal_val, rate_val, time_val, freq=freq
-            )
-            results.append(result[0])
-        
+        # Test increasing frequencies approaching continuous: freq
+        # broadcasts, so all six frequencies are evaluated in one call
+        frequencies = np.array([1.0, 4.0, 12.0, 52.0, 365.0, 8760.0])  # annual to hourly
+        results = discrete_compound_interest(
+            principal_val, rate_val, time_val, freq=frequencies
+        )
+
         # Each higher frequency should be closer to continuous
+        diffs = np.abs(results - continuous_result[0])
         for i in range(1, len(results)):
-            diff_prev = abs(results[i-1] - continuous_result[0])
-            diff_curr = abs(results[i] - continuous_result[0])
-            self.assertLessEqual(diff_curr, diff_prev)
-        
+            with self.subTest(freq=frequencies[i]):
+                self.assertLessEqual(diffs[i], diffs[i-1])
+
         # Hourly compounding should be very close to continuous
         self.assertAlmostEqual(
             results[-1], continuous_result[0], delta=0.01
@@ -186,20 +188,18 @@ class TestInterest(unittest.TestCase):
         time_val = np.array([2.0])  # 2 years
         
         simple_result = simple_interest(principal_val, rate_val, time_val)
-        compound_annual = discrete_compound_interest(
-            principal_val, rate_val, time_val, freq=1
-        )
-        compound_quarterly = discrete_compound_interest(
-            principal_val, rate_val, time_val, freq=4
+        # Both compounding frequencies in one broadcasted call
+        compound_annual, compound_quarterly = discrete_compound_interest(
+            principal_val, rate_val, time_val, freq=np.array([1.0, 4.0])
         )
         continuous_result = continuous_compound_interest(
             principal_val, rate_val, time_val
         )
-        
+
         # Order should be: simple < annual < quarterly < continuous
-        self.assertLess(simple_result[0], compound_annual[0])
-        self.assertLess(compound_annual[0], compound_quarterly[0])
-        self.assertLess(compound_quarterly[0], continuous_result[0])
+        self.assertLess(simple_result[0], compound_annual)
+        self.assertLess(compound_annual, compound_quarterly)
+        self.assertLess(compound_quarterly, continuous_result[0])
 
     def test_negative_rates(self):
         """Test interest calculations with negative rates (deflation)."""
@@ -259,7 +259,3 @@ class TestInterest(unittest.TestCase):
         self.assertEqual(len(simple_result), 2)
         self.assertEqual(len(compound_result), 2)
         self.assertEqual(len(continuous_result), 2)
-
-
-if __name__ == '__main__':
-    unittest.main()